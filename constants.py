@@ -13,6 +13,24 @@ DB_CONNECTION_STRING = (
     f"postgresql+psycopg2://{POSTGRES_USER}:{POSTGRES_PASSWORD}"
     f"@localhost:5432/{DATABASE_NAME}"
 )
+# Writes go to a single primary; reads are spread across a comma-separated
+# list of replicas, falling back to the writer when none are configured.
+DB_WRITER_CONNECTION_STRING = os.environ.get(
+    "EDP_WRITER_CONNECTION_STRING", DB_CONNECTION_STRING
+)
+DB_READER_CONNECTION_STRINGS = [
+    connection_string.strip()
+    for connection_string in os.environ.get("EDP_READER_CONNECTION_STRINGS", "").split(
+        ","
+    )
+    if connection_string.strip()
+]
+MAX_REPLICATION_LAG_SECONDS = float(
+    os.environ.get("EDP_MAX_REPLICATION_LAG_SECONDS", "5")
+)
+REPLICATION_LAG_CHECK_INTERVAL_SECONDS = float(
+    os.environ.get("EDP_REPLICATION_LAG_CHECK_INTERVAL_SECONDS", "1")
+)
 
 REPORT_DIR = "./reports"
 DATA_DIR = "./data"
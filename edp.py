@@ -5,7 +5,8 @@ import click
 from constants import (
     CPU_COUNT,
     DATA_DIR,
-    DB_CONNECTION_STRING,
+    DB_READER_CONNECTION_STRINGS,
+    DB_WRITER_CONNECTION_STRING,
     READ_BATCH_SIZE,
     WRITE_BATCH_SIZE,
 )
@@ -17,7 +18,9 @@ from services.metrics import EventMetricService
 
 logger = get_edp_logger()
 database_service = EventDatabaseService(
-    connection_string=DB_CONNECTION_STRING, logger=logger
+    connection_string=DB_WRITER_CONNECTION_STRING,
+    logger=logger,
+    reader_connection_strings=DB_READER_CONNECTION_STRINGS,
 )
 
 
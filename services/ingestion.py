@@ -12,7 +12,7 @@ from sqlalchemy.exc import OperationalError
 
 from constants import (
     CPU_COUNT,
-    DB_CONNECTION_STRING,
+    DB_WRITER_CONNECTION_STRING,
     EVENT_COLUMNS,
     FIRST_DIMENSION_CSV_FILENAME,
     KNOWN_EVENT_METRICS,
@@ -97,7 +97,7 @@ class EventDataIngestionService:
 
     @staticmethod
     def __write(table: str, file: TextFileReader, write_batch_size: int) -> None:
-        database: Engine = sqlalchemy.create_engine(DB_CONNECTION_STRING)
+        database: Engine = sqlalchemy.create_engine(DB_WRITER_CONNECTION_STRING)
 
         for batch in file:
             batch_to_use = batch
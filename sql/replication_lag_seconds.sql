@@ -0,0 +1,19 @@
+SELECT
+    CASE
+        WHEN NOT PG_IS_IN_RECOVERY() THEN 0
+        -- Replayed everything received only means "caught up" while a WAL
+        -- receiver is connected to the writer. pg_stat_wal_receiver has a
+        -- row only while the receiver process runs, which any role can see;
+        -- `status` is NULL unless the role is a superuser or a member of
+        -- pg_read_all_stats, so it is only checked when visible. A receiver
+        -- cut off from the writer exits after wal_receiver_timeout.
+        WHEN
+            PG_LAST_WAL_RECEIVE_LSN() = PG_LAST_WAL_REPLAY_LSN()
+            AND EXISTS (
+                SELECT 1 FROM pg_stat_wal_receiver
+                WHERE COALESCE(status, 'streaming') = 'streaming'
+            )
+            THEN 0
+        ELSE
+            EXTRACT(EPOCH FROM NOW() - PG_LAST_XACT_REPLAY_TIMESTAMP())
+    END AS replication_lag_seconds;
@@ -0,0 +1,246 @@
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.exc import OperationalError
+
+from services.database import EventDatabaseService
+
+# SQLite file copies stand in for a PostgreSQL writer and its readers.
+
+logger = logging.getLogger("edp")
+
+
+def create_databases(directory: Path, reader_count: int) -> List[str]:
+    writer_filename = str(directory / "writer.db")
+    EventDatabaseService(
+        connection_string=f"sqlite:///{writer_filename}", logger=logger
+    )
+
+    filenames = [writer_filename]
+
+    for reader_num in range(0, reader_count):
+        reader_filename = str(directory / f"reader-{reader_num}.db")
+        shutil.copyfile(writer_filename, reader_filename)
+        filenames.append(reader_filename)
+
+    return [f"sqlite:///{filename}" for filename in filenames]
+
+
+def routed_database(database_service: EventDatabaseService) -> str:
+    # Report queries are PostgreSQL-specific, so check routing directly.
+    reader = database_service._EventDatabaseService__reader()  # type: ignore
+    return Path(reader.url.database).name
+
+
+def test_reads_are_routed_round_robin_to_readers(tmp_path: Path):
+    writer, *readers = create_databases(tmp_path, reader_count=2)
+    database_service = EventDatabaseService(
+        connection_string=writer, logger=logger, reader_connection_strings=readers
+    )
+
+    routed_databases = [routed_database(database_service) for _ in range(0, 4)]
+    assert routed_databases == [
+        "reader-0.db",
+        "reader-1.db",
+        "reader-0.db",
+        "reader-1.db",
+    ]
+
+
+def test_reads_fall_back_to_writer_without_readers(tmp_path: Path):
+    writer, *_ = create_databases(tmp_path, reader_count=0)
+    database_service = EventDatabaseService(connection_string=writer, logger=logger)
+
+    assert routed_database(database_service) == "writer.db"
+
+
+def test_reads_skip_unreachable_readers(tmp_path: Path):
+    writer, reader = create_databases(tmp_path, reader_count=1)
+    unreachable_reader = f"sqlite:///{tmp_path}/missing/reader.db"
+    database_service = EventDatabaseService(
+        connection_string=writer,
+        logger=logger,
+        reader_connection_strings=[unreachable_reader, reader],
+    )
+
+    routed_databases = [routed_database(database_service) for _ in range(0, 2)]
+    assert routed_databases == ["reader-0.db", "reader-0.db"]
+
+
+@pytest.mark.parametrize(
+    "replication_lag_sql, expected_database",
+    [
+        ("SELECT 0.5;", "reader-0.db"),
+        ("SELECT 10;", "writer.db"),  # Over `max_replication_lag_seconds`
+        ("SELECT NULL;", "writer.db"),  # Lag is unknown (e.g. nothing replayed)
+    ],
+)
+def test_reads_fall_back_to_writer_when_replication_lag_exceeded(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    replication_lag_sql: str,
+    expected_database: str,
+):
+    writer, *readers = create_databases(tmp_path, reader_count=1)
+    database_service = EventDatabaseService(
+        connection_string=writer,
+        logger=logger,
+        reader_connection_strings=readers,
+        max_replication_lag_seconds=5,
+    )
+
+    # Run the PostgreSQL lag probe path against the SQLite reader.
+    replication_lag_sql_filename = tmp_path / "replication_lag_seconds.sql"
+    replication_lag_sql_filename.write_text(replication_lag_sql, encoding="utf-8")
+    monkeypatch.setattr(
+        "services.database.REPLICATION_LAG_SQL_FILENAME", replication_lag_sql_filename
+    )
+    monkeypatch.setattr(database_service.readers[0].dialect, "name", "postgresql")
+
+    assert routed_database(database_service) == expected_database
+
+
+@pytest.mark.parametrize(
+    "replication_lag_check_interval_seconds, expected_probe_count",
+    [
+        (60, 2),  # Each reader is probed once, then served from the cache
+        (0, 4),  # Each read probes its reader again
+    ],
+)
+def test_replication_lag_probes_are_cached(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    replication_lag_check_interval_seconds: float,
+    expected_probe_count: int,
+):
+    writer, *readers = create_databases(tmp_path, reader_count=2)
+    database_service = EventDatabaseService(
+        connection_string=writer,
+        logger=logger,
+        reader_connection_strings=readers,
+        replication_lag_check_interval_seconds=replication_lag_check_interval_seconds,
+    )
+    probed_readers = []
+
+    def replication_lag_seconds(reader: Engine) -> Optional[float]:
+        probed_readers.append(reader)
+        return 0.0
+
+    monkeypatch.setattr(
+        database_service,
+        "_EventDatabaseService__replication_lag_seconds",
+        replication_lag_seconds,
+    )
+
+    routed_databases = [routed_database(database_service) for _ in range(0, 4)]
+    assert routed_databases == [
+        "reader-0.db",
+        "reader-1.db",
+        "reader-0.db",
+        "reader-1.db",
+    ]
+    assert len(probed_readers) == expected_probe_count
+
+
+def test_read_after_write_lookups_use_writer(tmp_path: Path):
+    writer, *readers = create_databases(tmp_path, reader_count=1)
+    database_service = EventDatabaseService(
+        connection_string=writer, logger=logger, reader_connection_strings=readers
+    )
+
+    # Only the writer has the dimension; an empty reader must not be used.
+    with database_service.database.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO second_dimensions (id, name) VALUES (1, 'writer');"
+        )
+
+    assert database_service.random_second_dimension_id() == 1
+    assert database_service.total_events() == 0
+
+
+def test_report_queries_retry_on_writer_when_reader_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    writer, *readers = create_databases(tmp_path, reader_count=1)
+    database_service = EventDatabaseService(
+        connection_string=writer,
+        logger=logger,
+        reader_connection_strings=readers,
+        replication_lag_check_interval_seconds=60,
+    )
+    queried_databases = []
+
+    # The reader passes its lag probe, then goes down before the query runs.
+    def execute(
+        database: Engine, sql: str, parameters: Optional[Dict[str, str]] = None
+    ) -> List[Any]:
+        queried_databases.append(Path(database.url.database).name)
+
+        if database is not database_service.database:
+            raise OperationalError(sql, parameters, Exception("reader is down"))
+
+        return [("dimension", "2023-01-01 00:00:00", 1)]
+
+    monkeypatch.setattr(database_service, "_EventDatabaseService__execute", execute)
+
+    assert database_service.count_hourly_events_by_first_dimension() == [
+        ("dimension", "2023-01-01 00:00:00", 1)
+    ]
+    assert queried_databases == ["reader-0.db", "writer.db"]
+
+    # The failed reader's cached probe is dropped, so it is probed again.
+    probed_readers = []
+
+    def replication_lag_seconds(reader: Engine) -> Optional[float]:
+        probed_readers.append(reader)
+        return None
+
+    monkeypatch.setattr(
+        database_service,
+        "_EventDatabaseService__replication_lag_seconds",
+        replication_lag_seconds,
+    )
+
+    database_service.count_hourly_events_by_first_dimension()
+    assert probed_readers == database_service.readers
+    assert queried_databases[-1] == "writer.db"
+
+
+@pytest.mark.parametrize(
+    "replication_lag_seconds, expected_database",
+    [
+        (0.0, "reader-0.db"),
+        (None, "writer.db"),  # Every reader is excluded
+    ],
+)
+def test_report_queries_are_routed_to_readers(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    replication_lag_seconds: Optional[float],
+    expected_database: str,
+):
+    writer, *readers = create_databases(tmp_path, reader_count=2)
+    database_service = EventDatabaseService(
+        connection_string=writer, logger=logger, reader_connection_strings=readers
+    )
+    queried_databases = []
+
+    def execute(
+        database: Engine, sql: str, parameters: Optional[Dict[str, str]] = None
+    ) -> List[Any]:
+        queried_databases.append(Path(database.url.database).name)
+        return []
+
+    monkeypatch.setattr(database_service, "_EventDatabaseService__execute", execute)
+    monkeypatch.setattr(
+        database_service,
+        "_EventDatabaseService__replication_lag_seconds",
+        lambda reader: replication_lag_seconds,
+    )
+
+    database_service.count_hourly_events_by_first_dimension()
+    assert queried_databases == [expected_database]